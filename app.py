@@ -1,5 +1,7 @@
 import time
-from pysolarmanv5 import PySolarmanV5
+import queue
+import random
+from pysolarmanv5 import PySolarmanV5, NoSocketAvailableError, V5FrameError
 import os
 import dotenv
 
@@ -52,18 +54,131 @@ PARAMETERS = {
     ]
 }
 
-def read_and_interpret(modbus, param):
-    """Reads a register and interprets the value based on the defined rules."""
+# ===================================================================================
+# BLOCK READS
+# Every register above is fetched up front in a handful of multi-register requests
+# instead of one request per parameter. Each block is one Modbus round-trip through
+# the data logger; reading a few unused registers inside a block is far cheaper
+# than an extra request. The plan is derived from PARAMETERS once, at import.
+# ===================================================================================
+MERGE_GAP = 4         # Merge registers this close together into one block
+MAX_BLOCK_SIZE = 125  # Modbus limit for a single holding-register read
+SOCKET_TIMEOUT = 5    # Seconds to wait for the logger to answer one read
+
+# Errors that mean the logger is not answering or the connection is gone, as
+# opposed to the inverter rejecting a request (a Modbus exception response).
+# pysolarmanv5 reports a read timeout as queue.Empty, not as an OSError.
+TRANSPORT_ERRORS = (OSError, queue.Empty, NoSocketAvailableError)
+# pysolarmanv5 raises V5FrameError both for a corrupted reply frame and for
+# replies that come back the same every time (a Modbus exception response, a
+# wrong logger serial). Only corruption is worth retrying.
+TRANSIENT_FRAME_ERRORS = ("start or end values", "checksum", "sequence number")
+# Errors after which the socket is dead for good. pysolarmanv5 attempts a single
+# reconnect of its own; once that fails it never reconnects again.
+DEAD_SOCKET_ERRORS = (NoSocketAvailableError, ConnectionError)
+
+def build_read_plan(addresses, merge_gap=MERGE_GAP, max_size=MAX_BLOCK_SIZE):
+    """Merges register addresses into the fewest (start, count) blocks."""
+    blocks = []
+    for addr in sorted(set(addresses)):
+        if blocks:
+            start, count = blocks[-1]
+            end = start + count - 1
+            if addr - end <= merge_gap and addr - start < max_size:
+                blocks[-1] = (start, addr - start + 1)
+                continue
+        blocks.append((addr, 1))
+    return blocks
+
+def _param_registers():
+    for params in PARAMETERS.values():
+        for param in params:
+            if isinstance(param['reg'], list):
+                yield from param['reg']
+            else:
+                yield param['reg']
+
+REGISTER_BLOCKS = build_read_plan(_param_registers())
+
+_modbus_connection = None
+
+def get_modbus_connection():
+    """Returns the open logger connection, connecting first if there is none."""
+    global _modbus_connection
+    if _modbus_connection is None:
+        # auto_reconnect makes the library reconnect once and resend when the
+        # logger drops the socket mid-read
+        _modbus_connection = PySolarmanV5(INVERTER_IP, LOGGER_SERIAL, port=8899, mb_slave_id=1, verbose=False,
+                                          socket_timeout=SOCKET_TIMEOUT, auto_reconnect=True)
+    return _modbus_connection
+
+def safe_disconnect():
+    """Closes the logger connection, if any, so the next read opens a fresh one."""
+    global _modbus_connection
+    if _modbus_connection is not None:
+        try:
+            _modbus_connection.disconnect()
+        except Exception:
+            pass
+        _modbus_connection = None
+
+def _is_retryable(error):
+    """True for failures a retry might fix: transport errors and corrupted frames."""
+    if isinstance(error, V5FrameError):
+        return any(reason in str(error) for reason in TRANSIENT_FRAME_ERRORS)
+    return isinstance(error, TRANSPORT_ERRORS)
+
+def _backoff(attempt, base, cap):
+    """Exponential delay for a retry attempt, jittered so retries don't line up."""
+    return min(base * 2 ** attempt, cap) * (0.5 + random.random() * 0.5)
+
+def read_block(start, count, retries=3, base=0.2, cap=2.0):
+    """Reads `count` registers starting at `start`, keyed by absolute address.
+
+    Timeouts, lost connections and corrupted frames are retried with a jittered
+    exponential backoff, over a new connection if the old socket died. Anything
+    else, such as a Modbus exception response, is raised at once; a rejected
+    request would just be rejected again.
+    """
+    for attempt in range(retries):
+        try:
+            modbus = get_modbus_connection()
+            raw_list = modbus.read_holding_registers(register_addr=start, quantity=count)
+            return {start + i: value for i, value in enumerate(raw_list or [])}
+        except Exception as e:
+            if not _is_retryable(e):
+                raise
+            if isinstance(e, DEAD_SOCKET_ERRORS):
+                safe_disconnect()
+            if attempt == retries - 1:
+                raise
+            time.sleep(_backoff(attempt, base, cap))
+
+def read_snapshot():
+    """Reads every block in REGISTER_BLOCKS into a single address -> value dict."""
+    snapshot = {}
+    for start, count in REGISTER_BLOCKS:
+        try:
+            snapshot.update(read_block(start, count))
+        except TRANSPORT_ERRORS as e:
+            # The logger stopped answering; the remaining blocks would only time out too
+            print(f"  [!] Connection lost at registers {start}-{start + count - 1}: {str(e) or 'no response'}")
+            break
+        except Exception as e:
+            print(f"  [!] Failed to read registers {start}-{start + count - 1}: {e}")
+    return snapshot
+
+def read_and_interpret(snapshot, param):
+    """Looks up a register in the snapshot and interprets the value based on the defined rules."""
     try:
         raw_val = None
         is_32bit = isinstance(param['reg'], list)
 
         if is_32bit:
-            raw_list = modbus.read_holding_registers(register_addr=param['reg'][0], quantity=2)
-            if raw_list: raw_val = (raw_list[0] << 16) + raw_list[1]
+            high, low = snapshot.get(param['reg'][0]), snapshot.get(param['reg'][1])
+            if high is not None and low is not None: raw_val = (high << 16) + low
         else:
-            raw_list = modbus.read_holding_registers(register_addr=param['reg'], quantity=1)
-            if raw_list: raw_val = raw_list[0]
+            raw_val = snapshot.get(param['reg'])
 
         if raw_val is None: return "No response"
 
@@ -94,17 +209,24 @@ def main():
     print(f"Connecting to inverter at {INVERTER_IP}...")
 
     try:
-        modbus = PySolarmanV5(INVERTER_IP, LOGGER_SERIAL, port=8899, mb_slave_id=1, verbose=False)
+        get_modbus_connection()
         print("Connection successful. Reading data...\n")
     except Exception as e:
         print(f"\nFATAL: Could not connect to the inverter: {e}")
         print("Please check your INVERTER_IP, LOGGER_SERIAL, and network connection.")
         return
-    
+
+    # Block reads share one connection, reopened only if the logger drops it;
+    # close it once the snapshot is taken
+    try:
+        snapshot = read_snapshot()
+    finally:
+        safe_disconnect()
+
     for group, params in PARAMETERS.items():
         print(f"--- [ {group.upper()} ] ---")
         for param in params:
-            value_str = read_and_interpret(modbus, param)
+            value_str = read_and_interpret(snapshot, param)
             print(f"  {param['name']:<30}: {value_str}")
         print() 
 
@@ -1,11 +1,13 @@
 import requests
+from requests.adapters import HTTPAdapter
 import re
 import socket
 import ipaddress
 import time
+import asyncio
 
 # --- Scan the network for Deye inverters by checking for open port 8899 ---
-def find_deye_inverters(port=8899, timeout=1.0, max_scan=50):
+def find_deye_inverters(port=8899, timeout=1.0):
     def get_local_ip():
         """Get the local IP address of this machine (within the LAN)"""
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -17,47 +19,56 @@ def find_deye_inverters(port=8899, timeout=1.0, max_scan=50):
         finally:
             s.close()
 
-    def is_port_open(ip):
+    async def is_port_open(ip):
         """Check if the given IP has the specified port open (8899 for Deye)"""
         try:
-            with socket.create_connection((str(ip), port), timeout=timeout):
-                return str(ip)
-        except:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(str(ip), port), timeout)
+        except (OSError, asyncio.TimeoutError):
             return None
+        # The port is open; a reset while closing doesn't change that
+        try:
+            writer.close()
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return str(ip)
+
+    async def scan(ips):
+        return await asyncio.gather(*(is_port_open(ip) for ip in ips))
 
     local_ip = get_local_ip()
     network = ipaddress.IPv4Network(local_ip + '/24', strict=False)
     local_parts = local_ip.split(".")
     base_prefix = ".".join(local_parts[:3])
 
-    found = []
-    scanned = 0
+    ips = [f"{base_prefix}.{i}" for i in range(1, 255) if f"{base_prefix}.{i}" != local_ip]
 
-    for i in range(1, 255):
-        if scanned >= max_scan:
-            break
-        ip = f"{base_prefix}.{i}"
-        if ip == local_ip:
-            continue
-        result = is_port_open(ip)
-        if result:
-            found.append(result)
-        scanned += 1
+    # Probe the whole /24 at once on a single event loop; each check is just a
+    # wait on a TCP connect, so the scan takes about one timeout
+    results = asyncio.run(scan(ips))
 
-    return found
+    return [ip for ip in results if ip]
 
 # --- Fetch the serial number (cover_mid) from the inverter’s web interface ---
+# Matches the JavaScript variable from HTML: var cover_mid = "XXXXXXXXXX";
+_COVER_MID_RE = re.compile(rb'var\s+cover_mid\s*=\s*"(\d+)"')
+
+# One session for every status page request, so retries and repeat visits to
+# the same inverter reuse an open connection instead of reconnecting
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=0))
+
 def get_cover_mid(ip_address, username="admin", password="admin", retries=3):
     url = f"http://{ip_address}/status.html"
     for attempt in range(retries):
         try:
-            response = requests.get(url, auth=(username, password), timeout=5)
+            response = _session.get(url, auth=(username, password), timeout=5)
             response.raise_for_status()
 
-            # Match the JavaScript variable from HTML: var cover_mid = "XXXXXXXXXX";
-            match = re.search(r'var\s+cover_mid\s*=\s*"(\d+)"', response.text)
+            # Search the raw bytes; no need to decode the whole page to text
+            match = _COVER_MID_RE.search(response.content)
             if match:
-                return match.group(1)
+                return match.group(1).decode('ascii')
             else:
                 print("cover_mid not found in HTML.")
                 return None
@@ -71,11 +82,11 @@ def get_cover_mid(ip_address, username="admin", password="admin", retries=3):
 
 # --- Main function: find inverter and get serial number ---
 def get_info():
-    ip_list = find_deye_inverters(timeout=1.0, max_scan=50)
+    ip_list = find_deye_inverters(timeout=1.0)
     if not ip_list:
         print("[!] No inverters found, retrying...")
         time.sleep(1)
-        ip_list = find_deye_inverters(timeout=1.0, max_scan=50)
+        ip_list = find_deye_inverters(timeout=1.0)
 
     for ip in ip_list:
         time.sleep(1)